@@ -8,17 +8,30 @@ romper la lógica interna del combate.
 
 from __future__ import annotations
 
+import os
 import re
+import struct
 import sys
 import time
+import zlib
 from dataclasses import dataclass, field
 from itertools import zip_longest
 from random import random, uniform
-from typing import Dict, Iterable, List, Tuple
+from typing import Dict, Iterable, List, Mapping, Optional, Tuple
 
-from colorama import Fore, Style, init
+from renderizado import ANSI_PATTERN, BACKENDS, RenderPlano, crear_renderizador, validar_estilos
 
-init(autoreset=True)
+# Backend de salida activo. Al importar el módulo es texto plano, sin importar
+# colorama ni rich, y ``clear_screen`` solo imprime una línea en blanco;
+# ``bucle_principal`` instala el backend que recibe ("ansi" por defecto).
+render: RenderPlano = RenderPlano()
+
+
+def usar_renderizador(nombre: str) -> RenderPlano:
+    """Selecciona el backend de renderizado ("plano", "ansi" o "rich")."""
+    global render
+    render = crear_renderizador(nombre)
+    return render
 
 
 # ---------------------------------------------------------------------------
@@ -32,7 +45,7 @@ def clamp(value: int, minimo: int, maximo: int) -> int:
 
 def clear_screen() -> None:
     """Limpia la terminal."""
-    print("\033[2J\033[H", end="")
+    render.limpiar_pantalla()
 
 
 def slow_print(texto: str, delay: float = 0.0) -> None:
@@ -49,10 +62,10 @@ def slow_print(texto: str, delay: float = 0.0) -> None:
 def ratio_color(ratio: float) -> str:
     """Devuelve el color correspondiente al porcentaje de vida."""
     if ratio >= 0.6:
-        return Fore.GREEN
+        return "verde"
     if ratio >= 0.3:
-        return Fore.YELLOW
-    return Fore.RED
+        return "amarillo"
+    return "rojo"
 
 
 def barra(actual: int, maximo: int, longitud: int, llenos: str, vacios: str, color: str) -> str:
@@ -62,15 +75,12 @@ def barra(actual: int, maximo: int, longitud: int, llenos: str, vacios: str, col
     filled = int(round((actual / maximo) * longitud))
     filled = clamp(filled, 0, longitud)
     contenido = llenos * filled + vacios * (longitud - filled)
-    return f"{color}{contenido}{Style.RESET_ALL}"
-
-
-ANSI_PATTERN = re.compile(r"\x1b\[[0-9;]*m")
+    return render.estilo(contenido, color)
 
 
 def ancho_visual(texto: str) -> int:
     """Longitud sin secuencias ANSI."""
-    return len(ANSI_PATTERN.sub("", texto))
+    return render.ancho_visual(texto)
 
 
 def pad_ansi(texto: str, ancho: int) -> str:
@@ -89,9 +99,10 @@ def iconos_estado(fighter: "Fighter") -> str:
 
 
 # Ajusta estos colores si cambias los nombres de los combatientes principales.
+# ➜ Usa nombres de ``renderizado.ESTILOS``; se comprueban al importar el módulo.
 NOMBRE_COLORES = {
-    "Jugador": Fore.CYAN,
-    "Enemigo": Fore.RED,
+    "Jugador": "cian",
+    "Enemigo": "rojo",
 }
 
 
@@ -100,18 +111,20 @@ def panel_lines(fighter: "Fighter", ancho: int = 38) -> List[str]:
     hp_ratio = fighter.hp / fighter.max_hp if fighter.max_hp else 0
     color_hp = ratio_color(hp_ratio)
     barra_hp = barra(fighter.hp, fighter.max_hp, 20, "█", "·", color_hp)
-    barra_en = barra(fighter.en, fighter.max_en, 20, "■", "·", Fore.CYAN)
+    barra_en = barra(fighter.en, fighter.max_en, 20, "■", "·", "cian")
     estados = iconos_estado(fighter) or "—"
-    color_nombre = NOMBRE_COLORES.get(fighter.nombre, Fore.WHITE)
-    nombre = f"{color_nombre}{Style.BRIGHT}{fighter.nombre}{Style.RESET_ALL}"
+    color_nombre = NOMBRE_COLORES.get(fighter.nombre, "blanco")
+    estilo = render.estilo
+    nombre = estilo(fighter.nombre, color_nombre, "brillante")
     if estados != "—":
-        nombre = f"{nombre} {Style.DIM}{estados}{Style.RESET_ALL}"
+        nombre = f"{nombre} {estilo(estados, 'tenue')}"
+    abre, cierra = estilo("[", "tenue"), estilo("]", "tenue")
 
     lineas = [
         nombre,
-        f"HP {Style.DIM}[{Style.RESET_ALL}{barra_hp}{Style.DIM}]{Style.RESET_ALL} {color_hp}{fighter.hp:>3}{Style.RESET_ALL}/{fighter.max_hp:<3}",
-        f"EN {Style.DIM}[{Style.RESET_ALL}{barra_en}{Style.DIM}]{Style.RESET_ALL} {Fore.CYAN}{fighter.en:>3}{Style.RESET_ALL}/{fighter.max_en:<3}",
-        f"⚡ Cargas: {fighter.cargas:<2} Estado: {Style.DIM}{estados}{Style.RESET_ALL}",
+        f"HP {abre}{barra_hp}{cierra} {estilo(f'{fighter.hp:>3}', color_hp)}/{fighter.max_hp:<3}",
+        f"EN {abre}{barra_en}{cierra} {estilo(f'{fighter.en:>3}', 'cian')}/{fighter.max_en:<3}",
+        f"⚡ Cargas: {fighter.cargas:<2} Estado: {estilo(estados, 'tenue')}",
     ]
 
     return [pad_ansi(linea, ancho) for linea in lineas]
@@ -396,21 +409,27 @@ def log_defensa(actor: Fighter) -> str:
 
 
 HIGHLIGHT_TERMS = [
-    # Añade o cambia palabras clave y colores del registro aquí.
-    ("ESPECIAL", Fore.MAGENTA),
-    ("CRÍTICO", Fore.LIGHTRED_EX),
-    ("ESQUIVA", Fore.LIGHTBLUE_EX),
-    ("RECARGA", Fore.GREEN),
-    ("DEFENSA", Fore.YELLOW),
+    # Añade o cambia palabras clave y colores del registro aquí
+    # (colores de ``renderizado.ESTILOS``).
+    ("ESPECIAL", "magenta"),
+    ("CRÍTICO", "rojo_claro"),
+    ("ESQUIVA", "azul_claro"),
+    ("RECARGA", "verde"),
+    ("DEFENSA", "amarillo"),
 ]
 
+# Un color mal escrito falla aquí con cualquier backend, no solo con color.
+validar_estilos([*NOMBRE_COLORES.values(), *(color for _, color in HIGHLIGHT_TERMS)])
+
 
 def aplicar_resaltado(texto: str) -> str:
+    if not render.color:
+        return texto
     resaltado = texto
     for termino, color in HIGHLIGHT_TERMS:
         resaltado = re.sub(
             rf"(?<!\w){termino}(?!\w)",
-            lambda m: f"{Style.BRIGHT}{color}{m.group(0)}{Style.RESET_ALL}",
+            lambda m: render.estilo(m.group(0), "brillante", color),
             resaltado,
         )
     return resaltado
@@ -418,16 +437,18 @@ def aplicar_resaltado(texto: str) -> str:
 
 def resaltar_log(linea: str) -> str:
     """Añade color según el emisor y resalta palabras clave."""
+    if not render.color:
+        return linea
     if linea.startswith("Jugador:"):
-        linea = f"{Style.BRIGHT}{Fore.CYAN}Jugador{Style.RESET_ALL}{linea[len('Jugador') :]}"
+        linea = f"{render.estilo('Jugador', 'brillante', 'cian')}{linea[len('Jugador') :]}"
     elif linea.startswith("Enemigo:"):
-        linea = f"{Style.BRIGHT}{Fore.RED}Enemigo{Style.RESET_ALL}{linea[len('Enemigo') :]}"
+        linea = f"{render.estilo('Enemigo', 'brillante', 'rojo')}{linea[len('Enemigo') :]}"
     elif linea.startswith("Ronda "):
-        return f"{Style.DIM}{linea}{Style.RESET_ALL}"
+        return render.estilo(linea, "tenue")
     elif linea.startswith("Entrada inválida"):
-        return f"{Fore.YELLOW}{linea}{Style.RESET_ALL}"
+        return render.estilo(linea, "amarillo")
     elif linea.startswith("Salida del juego"):
-        return f"{Fore.YELLOW}{linea}{Style.RESET_ALL}"
+        return render.estilo(linea, "amarillo")
     return aplicar_resaltado(linea)
 
 def ejecutar_ataque(atacante: Fighter, defensor: Fighter, base: int, mult: float, coste: int, etiqueta: str) -> str:
@@ -461,45 +482,305 @@ def resumen_ronda(n: int, jugador: Fighter, enemigo: Fighter) -> str:
 
 def mostrar_historial(historial: List[str], limite: int = 3) -> None:
     if not historial:
-        print(f"  {Style.DIM}• Sin eventos previos.{Style.RESET_ALL}")
+        print(f"  {render.estilo('• Sin eventos previos.', 'tenue')}")
         return
+    vineta = render.estilo("•", "tenue")
     for linea in historial[-limite:]:
-        print(f"  {Style.DIM}•{Style.RESET_ALL} {linea}")
+        print(f"  {vineta} {linea}")
 
 
 def mostrar_encabezado(ronda: int) -> None:
     titulo = f" BATALLA TÁCTICA — RONDA {ronda:02d} "
     borde = "═" * len(titulo)
-    print(f"{Style.BRIGHT}{Fore.MAGENTA}╔{borde}╗{Style.RESET_ALL}")
-    print(f"{Style.BRIGHT}{Fore.MAGENTA}║{titulo}║{Style.RESET_ALL}")
-    print(f"{Style.BRIGHT}{Fore.MAGENTA}╚{borde}╝{Style.RESET_ALL}")
+    print(render.estilo(f"╔{borde}╗", "brillante", "magenta"))
+    print(render.estilo(f"║{titulo}║", "brillante", "magenta"))
+    print(render.estilo(f"╚{borde}╝", "brillante", "magenta"))
+
+
+# ---------------------------------------------------------------------------
+# Persistencia de partidas
+# ---------------------------------------------------------------------------
+
+# Formato binario versionado de las instantáneas. Cualquier cambio en el
+# diseño de las estructuras debe ir acompañado de un nuevo número de versión.
+SNAPSHOT_MAGIC = b"BT"
+SNAPSHOT_VERSION = 1
+# Las probabilidades (crit/evd) se guardan como enteros en diezmilésimas.
+ESCALA_PROBABILIDAD = 10_000
+FLAG_DEF = 0x01
+
+# magic, versión, ronda, jugador_recargo
+_CABECERA = struct.Struct("<2sBHB")
+# max_hp, max_en, atk, df, crit, evd, hp, en, cargas, estados
+_COMBATIENTE = struct.Struct("<HHHHHHHHBB")
+_CHECKSUM = struct.Struct("<I")
+SNAPSHOT_SIZE = _CABECERA.size + 2 * _COMBATIENTE.size + _CHECKSUM.size
+
+# Archivo con varias partidas: magic, versión, número de registros.
+LOTE_MAGIC = b"BTL"
+_LOTE_CABECERA = struct.Struct("<3sBI")
+_LOTE_SESION = struct.Struct("<Q")
+
+
+@dataclass
+class Partida:
+    """Estado completo necesario para reanudar un combate."""
+
+    jugador: Fighter
+    enemigo: Fighter
+    ronda: int = 1
+    jugador_recargo: bool = False
+
+
+def _empaquetar_combatiente(fighter: Fighter) -> bytes:
+    estados = FLAG_DEF if "DEF" in fighter.estado else 0
+    return _COMBATIENTE.pack(
+        fighter.max_hp,
+        fighter.max_en,
+        fighter.atk,
+        fighter.df,
+        round(fighter.crit * ESCALA_PROBABILIDAD),
+        round(fighter.evd * ESCALA_PROBABILIDAD),
+        fighter.hp,
+        fighter.en,
+        fighter.cargas,
+        estados,
+    )
+
+
+def _desempaquetar_combatiente(nombre: str, datos: bytes, offset: int) -> Fighter:
+    max_hp, max_en, atk, df, crit, evd, hp, en, cargas, estados = _COMBATIENTE.unpack_from(datos, offset)
+    fighter = Fighter(
+        nombre,
+        max_hp,
+        max_en,
+        atk,
+        df,
+        crit / ESCALA_PROBABILIDAD,
+        evd / ESCALA_PROBABILIDAD,
+    )
+    fighter.hp = hp
+    fighter.en = en
+    fighter.cargas = cargas
+    if estados & FLAG_DEF:
+        fighter.estado.add("DEF")
+    return fighter
+
+
+def serializar_partida(partida: Partida) -> bytes:
+    """Codifica la partida en una instantánea de tamaño fijo con checksum CRC32.
+
+    Los nombres y el historial no se guardan: los nombres son los fijos del
+    bucle principal y el historial es solo informativo.
+    """
+    cuerpo = b"".join(
+        (
+            _CABECERA.pack(SNAPSHOT_MAGIC, SNAPSHOT_VERSION, partida.ronda, int(partida.jugador_recargo)),
+            _empaquetar_combatiente(partida.jugador),
+            _empaquetar_combatiente(partida.enemigo),
+        )
+    )
+    return cuerpo + _CHECKSUM.pack(zlib.crc32(cuerpo))
+
+
+def deserializar_partida(
+    datos: bytes,
+    nombre_jugador: str = "Jugador",
+    nombre_enemigo: str = "Enemigo",
+) -> Partida:
+    """Reconstruye una partida a partir de una instantánea.
+
+    Lanza ``ValueError`` si el tamaño, la cabecera o el checksum no coinciden.
+    """
+    if len(datos) != SNAPSHOT_SIZE:
+        raise ValueError(f"Instantánea de tamaño inválido: {len(datos)} bytes (se esperaban {SNAPSHOT_SIZE}).")
+    cuerpo = datos[: -_CHECKSUM.size]
+    (checksum,) = _CHECKSUM.unpack_from(datos, len(cuerpo))
+    if zlib.crc32(cuerpo) != checksum:
+        raise ValueError("Instantánea corrupta: checksum incorrecto.")
+    magic, version, ronda, jugador_recargo = _CABECERA.unpack_from(datos, 0)
+    if magic != SNAPSHOT_MAGIC:
+        raise ValueError("Los datos no son una instantánea de Batalla Táctica.")
+    if version != SNAPSHOT_VERSION:
+        raise ValueError(f"Versión de instantánea no soportada: {version}.")
+    offset = _CABECERA.size
+    jugador = _desempaquetar_combatiente(nombre_jugador, datos, offset)
+    enemigo = _desempaquetar_combatiente(nombre_enemigo, datos, offset + _COMBATIENTE.size)
+    return Partida(jugador, enemigo, ronda, bool(jugador_recargo))
+
+
+def _crear_temporal(directorio: str) -> Tuple[int, str]:
+    """Crea un temporal exclusivo en ``directorio``.
+
+    Se pide el modo 0o666 y el kernel aplica la umask, igual que con ``open``;
+    así no hace falta consultar (ni modificar) la umask del proceso.
+    """
+    flags = os.O_CREAT | os.O_EXCL | os.O_WRONLY | getattr(os, "O_BINARY", 0)
+    while True:
+        temporal = os.path.join(directorio, f".batalla-{os.urandom(6).hex()}.tmp")
+        try:
+            return os.open(temporal, flags, 0o666), temporal
+        except FileExistsError:
+            continue
+
+
+def _sincronizar_directorio(directorio: str) -> None:
+    """Persiste en disco el renombrado hecho dentro de ``directorio``."""
+    if os.name == "nt":
+        # Windows no permite abrir directorios; NTFS registra el renombrado.
+        return
+    fd = os.open(directorio, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def _escribir_atomico(ruta: str, datos: bytes) -> None:
+    """Escribe en un temporal del mismo directorio y lo renombra sobre ``ruta``.
+
+    Si ``ruta`` ya existe, conserva sus permisos.
+    """
+    directorio = os.path.dirname(os.path.abspath(ruta))
+    fd, temporal = _crear_temporal(directorio)
+    try:
+        with os.fdopen(fd, "wb") as archivo:
+            archivo.write(datos)
+            archivo.flush()
+            os.fsync(archivo.fileno())
+        try:
+            modo = os.stat(ruta).st_mode & 0o777
+        except FileNotFoundError:
+            pass
+        else:
+            os.chmod(temporal, modo)
+        os.replace(temporal, ruta)
+    except BaseException:
+        try:
+            os.unlink(temporal)
+        except FileNotFoundError:
+            pass
+        raise
+    _sincronizar_directorio(directorio)
+
+
+def guardar_partida(ruta: str, partida: Partida) -> None:
+    """Guarda una única partida de forma atómica."""
+    _escribir_atomico(ruta, serializar_partida(partida))
+
+
+def cargar_partida(ruta: str) -> Optional[Partida]:
+    """Carga la partida guardada en ``ruta`` o devuelve ``None`` si no existe."""
+    try:
+        with open(ruta, "rb") as archivo:
+            datos = archivo.read()
+    except FileNotFoundError:
+        return None
+    return deserializar_partida(datos)
+
+
+def guardar_lote(ruta: str, partidas: Mapping[int, Partida]) -> None:
+    """Guarda muchas partidas (indexadas por id de sesión) en un solo archivo.
+
+    El archivo se sustituye de forma atómica, por lo que un fallo a mitad de
+    escritura deja intacta la versión anterior.
+    """
+    bloques = [_LOTE_CABECERA.pack(LOTE_MAGIC, SNAPSHOT_VERSION, len(partidas))]
+    for sesion, partida in partidas.items():
+        bloques.append(_LOTE_SESION.pack(sesion))
+        bloques.append(serializar_partida(partida))
+    _escribir_atomico(ruta, b"".join(bloques))
+
+
+def cargar_lote(ruta: str) -> Dict[int, Partida]:
+    """Lee un archivo generado por ``guardar_lote``."""
+    with open(ruta, "rb") as archivo:
+        datos = archivo.read()
+    if len(datos) < _LOTE_CABECERA.size:
+        raise ValueError("Archivo de lote truncado.")
+    magic, version, total = _LOTE_CABECERA.unpack_from(datos, 0)
+    if magic != LOTE_MAGIC:
+        raise ValueError("Los datos no son un lote de Batalla Táctica.")
+    if version != SNAPSHOT_VERSION:
+        raise ValueError(f"Versión de lote no soportada: {version}.")
+    registro = _LOTE_SESION.size + SNAPSHOT_SIZE
+    if len(datos) != _LOTE_CABECERA.size + total * registro:
+        raise ValueError("Archivo de lote truncado.")
+
+    partidas: Dict[int, Partida] = {}
+    offset = _LOTE_CABECERA.size
+    for _ in range(total):
+        (sesion,) = _LOTE_SESION.unpack_from(datos, offset)
+        inicio = offset + _LOTE_SESION.size
+        partidas[sesion] = deserializar_partida(datos[inicio : inicio + SNAPSHOT_SIZE])
+        offset += registro
+    return partidas
+
+
+def borrar_partida(ruta: str) -> None:
+    try:
+        os.remove(ruta)
+    except FileNotFoundError:
+        pass
+
+
 # ---------------------------------------------------------------------------
 # Bucle principal
 # ---------------------------------------------------------------------------
 
 
-def bucle_principal() -> None:
-    # ➜ Ajusta aquí las estadísticas iniciales de cada combatiente.
-    #    Respeta el orden Fighter(nombre, max_hp, max_en, atk, df, crit, evd)
-    #    y utiliza valores coherentes para evitar desbalances extremos.
-    jugador = Fighter("Jugador", 100, 18, 9, 4, 0.15, 0.08)
-    enemigo = Fighter("Enemigo", 100, 16, 8, 5, 0.10, 0.06)
+def bucle_principal(ruta_guardado: Optional[str] = None, renderizador: str = "ansi") -> None:
+    """Ejecuta una partida; con ``ruta_guardado`` se reanuda y se guarda cada ronda.
 
-    ronda = 1
-    jugador_recargo = False
+    ``renderizador`` elige el backend de salida ("plano", "ansi" o "rich") y
+    sustituye al activo en el módulo.
+    """
+    usar_renderizador(renderizador)
+    try:
+        partida = cargar_partida(ruta_guardado) if ruta_guardado else None
+    except (OSError, ValueError) as error:
+        # No se sobrescribe el archivo: podría no ser una partida guardada.
+        print(f"No se puede leer la partida guardada en {ruta_guardado}: {error}")
+        print("Bórrala o indica otra ruta para empezar una partida nueva.")
+        return
+    if partida is None:
+        # ➜ Ajusta aquí las estadísticas iniciales de cada combatiente.
+        #    Respeta el orden Fighter(nombre, max_hp, max_en, atk, df, crit, evd)
+        #    y utiliza valores coherentes para evitar desbalances extremos.
+        partida = Partida(
+            Fighter("Jugador", 100, 18, 9, 4, 0.15, 0.08),
+            Fighter("Enemigo", 100, 16, 8, 5, 0.10, 0.06),
+        )
+
+    jugador = partida.jugador
+    enemigo = partida.enemigo
+    ronda = partida.ronda
+    jugador_recargo = partida.jugador_recargo
     historial: List[str] = []
 
+    def guardar() -> None:
+        """Guarda la ronda actual; si falla, avisa y la partida sigue sin guardarse."""
+        partida.ronda = ronda
+        partida.jugador_recargo = jugador_recargo
+        try:
+            guardar_partida(ruta_guardado, partida)
+        except OSError as error:
+            aviso = render.estilo(f"No se pudo guardar la partida en {ruta_guardado}: {error}", "amarillo")
+            print(aviso)
+            historial.append(aviso)
+
+    if ruta_guardado and jugador.vivo() and enemigo.vivo():
+        guardar()
+
     while jugador.vivo() and enemigo.vivo():
         clear_screen()
         mostrar_encabezado(ronda)
         mostrar_paneles(jugador, enemigo)
         print()
-        print(f"{Style.BRIGHT}Registro reciente:{Style.RESET_ALL}")
+        print(render.estilo("Registro reciente:", "brillante"))
         mostrar_historial(historial)
         print()
-        print(
-            f"{Style.DIM}[A]tacar [D]efender [E]special [R]ecargar [Q]uitar{Style.RESET_ALL}"
-        )
+        print(render.estilo("[A]tacar [D]efender [E]special [R]ecargar [Q]uitar", "tenue"))
 
         accion = solicitar_accion()
         if accion == "Q":
@@ -571,28 +852,55 @@ def bucle_principal() -> None:
         historial.append(mostrado_resumen)
         ronda += 1
         if jugador.vivo() and enemigo.vivo():
+            # Se guarda ya resuelta: cerrar el proceso en la pausa no repite la ronda.
+            if ruta_guardado:
+                guardar()
             input("Continuar... ")
 
+    if ruta_guardado:
+        try:
+            borrar_partida(ruta_guardado)
+        except OSError as error:
+            print(render.estilo(f"No se pudo borrar la partida guardada en {ruta_guardado}: {error}", "amarillo"))
+
     if jugador.vivo() and not enemigo.vivo():
-        print(f"{Style.BRIGHT}{Fore.GREEN}Victoria.{Style.RESET_ALL}")
+        print(render.estilo("Victoria.", "brillante", "verde"))
     elif enemigo.vivo() and not jugador.vivo():
-        print(f"{Style.BRIGHT}{Fore.RED}Derrota.{Style.RESET_ALL}")
+        print(render.estilo("Derrota.", "brillante", "rojo"))
     else:
-        print(f"{Style.BRIGHT}{Fore.YELLOW}Empate.{Style.RESET_ALL}")
+        print(render.estilo("Empate.", "brillante", "amarillo"))
 
 
 def solicitar_accion() -> str:
     while True:
-        respuesta = input(
-            f"{Style.BRIGHT}{Fore.CYAN}Acción{Style.RESET_ALL}: "
-        ).strip().upper()
+        respuesta = input(f"{render.estilo('Acción', 'brillante', 'cian')}: ").strip().upper()
         if respuesta in {"A", "D", "E", "R", "Q"}:
             return respuesta
         print("Entrada inválida.")
 
 
+def parsear_argumentos(argv: Optional[List[str]] = None) -> "argparse.Namespace":
+    # argparse solo hace falta al ejecutar el script, no al importar el módulo.
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Batalla táctica por turnos para terminal.")
+    parser.add_argument(
+        "guardado",
+        nargs="?",
+        help="archivo de instantánea para guardar cada ronda y reanudar la partida",
+    )
+    parser.add_argument(
+        "--render",
+        choices=sorted(BACKENDS),
+        default="ansi",
+        help="backend de salida (por defecto: ansi con colorama)",
+    )
+    return parser.parse_args(argv)
+
+
 if __name__ == "__main__":
+    argumentos = parsear_argumentos()
     try:
-        bucle_principal()
+        bucle_principal(argumentos.guardado, argumentos.render)
     except KeyboardInterrupt:
         sys.exit("\nInterrumpido por el usuario.")
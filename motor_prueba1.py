@@ -0,0 +1,470 @@
+"""Motor sin interfaz para las reglas de ``prueba1.py``.
+
+Representa la partida como una tupla de enteros y separa la lógica de las
+reglas (ataque por municiones, recarga de energía, recarga de vida y obtención
+de recargas) de la entrada/salida con ``rich``. Incluye un avance por lotes
+en columnas para simulaciones masivas y distribuciones exactas de daño
+calculadas a partir de los rangos uniformes de ``randint``.
+
+Ejemplo rápido::
+
+    from motor_prueba1 import comparar_ataques, simular
+    comparar_ataques(30)
+    simular(politica_fija(ATACAR_1), politica_fija(ATACAR_3), partidas=10_000)
+"""
+
+from __future__ import annotations
+
+import random
+from fractions import Fraction
+from itertools import compress, repeat
+from operator import add, and_, eq, ge, gt, le, lt, mul, sub, xor
+from typing import Callable, Dict, Iterator, List, NamedTuple, Optional, Sequence, Tuple
+
+# ---------------------------------------------------------------------------
+# Parámetros de las reglas
+# ---------------------------------------------------------------------------
+
+# ➜ Mantén estos valores sincronizados con los mensajes de ``prueba1.py``.
+VIDA_INICIAL = 100
+VIDA_MAX = 125
+ENERGIA_INICIAL = 3
+ENERGIA_MAX = 5
+RECARGAS_INICIALES = 1
+RECARGA_ENERGIA = (1, 2)
+RECARGA_VIDA = (1, 15)
+# ➜ Denominador de 256 como máximo: las tiradas por lote usan un byte.
+PROB_OBTENER_RECARGA = Fraction(1, 2)
+
+# municiones -> (caras del dado, multiplicador): daño = randint(1, caras) * mult
+DADOS_ATAQUE: Dict[int, Tuple[int, int]] = {
+    1: (20, 1),
+    2: (18, 2),
+    3: (15, 3),
+}
+
+# Acciones codificadas como enteros; las de ataque coinciden con las municiones.
+ATACAR_1 = 1
+ATACAR_2 = 2
+ATACAR_3 = 3
+RECARGAR_ENERGIA = 4
+RECARGAR_VIDA = 5
+OBTENER_RECARGA = 6
+ACCIONES = (ATACAR_1, ATACAR_2, ATACAR_3, RECARGAR_ENERGIA, RECARGAR_VIDA, OBTENER_RECARGA)
+
+# (vida1, energia1, recargas1, vida2, energia2, recargas2, turno)
+# ``turno`` vale 0 si actúa el jugador 1 y 1 si actúa el jugador 2.
+Estado = Tuple[int, int, int, int, int, int, int]
+Politica = Callable[[Estado], int]
+# Lote de partidas en columnas: [vida1, energia1, recargas1, vida2, energia2, recargas2, turno]
+Columnas = List[List[int]]
+
+ESTADO_INICIAL: Estado = (
+    VIDA_INICIAL, ENERGIA_INICIAL, RECARGAS_INICIALES,
+    VIDA_INICIAL, ENERGIA_INICIAL, RECARGAS_INICIALES,
+    0,
+)
+
+
+# ---------------------------------------------------------------------------
+# Reglas individuales
+# ---------------------------------------------------------------------------
+
+
+def ataque_valido(energia: int, municiones: int) -> bool:
+    """Indica si el ataque puede realizarse con la energía disponible."""
+    return municiones in DADOS_ATAQUE and 0 < municiones <= energia
+
+
+def dano_ataque(municiones: int, rng: Optional[random.Random] = None) -> int:
+    """Tira el daño de un ataque válido con las mismas llamadas que ``prueba1.py``.
+
+    Sin ``rng`` se usa el generador global del módulo ``random``.
+    """
+    caras, mult = DADOS_ATAQUE[municiones]
+    return (rng or random).randint(1, caras) * mult
+
+
+def tirada_recarga_energia(rng: Optional[random.Random] = None) -> int:
+    return (rng or random).randint(*RECARGA_ENERGIA)
+
+
+def tirada_recarga_vida(rng: Optional[random.Random] = None) -> int:
+    return (rng or random).randint(*RECARGA_VIDA)
+
+
+def tirada_obtener_recarga(rng: Optional[random.Random] = None) -> bool:
+    """Éxito con probabilidad ``PROB_OBTENER_RECARGA``.
+
+    Con 1/2 consume el generador igual que ``random.choice([True, False])``.
+    """
+    return (rng or random).randrange(PROB_OBTENER_RECARGA.denominator) < PROB_OBTENER_RECARGA.numerator
+
+
+def terminado(estado: Estado) -> bool:
+    return estado[0] <= 0 or estado[3] <= 0
+
+
+def ganador(estado: Estado) -> int:
+    """Devuelve 1 o 2 según quién ganó, o 0 si la partida sigue en curso."""
+    if estado[3] <= 0:
+        return 1
+    if estado[0] <= 0:
+        return 2
+    return 0
+
+
+def _aplicar(estado: Estado, accion: int, tirada: int) -> Estado:
+    """Aplica ``accion`` con el resultado de ``tirada`` ya decidido.
+
+    ``tirada`` es el valor del dado de la acción (daño, energía o vida
+    recuperada; 1/0 para obtener recarga). Las acciones inválidas consumen el
+    turno sin cambiar nada, igual que en el juego interactivo.
+    """
+    v1, e1, r1, v2, e2, r2, turno = estado
+    if turno:
+        vida, energia, recargas, vida_rival = v2, e2, r2, v1
+    else:
+        vida, energia, recargas, vida_rival = v1, e1, r1, v2
+
+    if accion in DADOS_ATAQUE:
+        if ataque_valido(energia, accion):
+            energia -= accion
+            vida_rival -= tirada
+    elif accion == RECARGAR_ENERGIA:
+        if energia < ENERGIA_MAX:
+            energia = min(energia + tirada, ENERGIA_MAX)
+    elif accion == RECARGAR_VIDA:
+        if recargas > 0:
+            vida = min(vida + tirada, VIDA_MAX)
+            recargas -= 1
+    elif accion == OBTENER_RECARGA:
+        if recargas < 1 and tirada:
+            recargas += 1
+    else:
+        raise ValueError(f"Acción desconocida: {accion}.")
+
+    if turno:
+        return (vida_rival, e1, r1, vida, energia, recargas, 0)
+    return (vida, energia, recargas, vida_rival, e2, r2, 1)
+
+
+def _tirar(accion: int, rng: Optional[random.Random] = None) -> int:
+    if accion in DADOS_ATAQUE:
+        return dano_ataque(accion, rng)
+    if accion == RECARGAR_ENERGIA:
+        return tirada_recarga_energia(rng)
+    if accion == RECARGAR_VIDA:
+        return tirada_recarga_vida(rng)
+    if accion == OBTENER_RECARGA:
+        return int(tirada_obtener_recarga(rng))
+    raise ValueError(f"Acción desconocida: {accion}.")
+
+
+def paso(estado: Estado, accion: int, rng: Optional[random.Random] = None) -> Estado:
+    """Ejecuta la acción del jugador en turno y devuelve el nuevo estado."""
+    return _aplicar(estado, accion, _tirar(accion, rng))
+
+
+# ---------------------------------------------------------------------------
+# Distribuciones exactas
+# ---------------------------------------------------------------------------
+
+
+def distribucion_tirada(accion: int) -> Dict[int, Fraction]:
+    """Distribución exacta del dado asociado a ``accion``."""
+    if accion in DADOS_ATAQUE:
+        caras, mult = DADOS_ATAQUE[accion]
+        return {k * mult: Fraction(1, caras) for k in range(1, caras + 1)}
+    if accion == RECARGAR_ENERGIA:
+        minimo, maximo = RECARGA_ENERGIA
+    elif accion == RECARGAR_VIDA:
+        minimo, maximo = RECARGA_VIDA
+    elif accion == OBTENER_RECARGA:
+        return {1: PROB_OBTENER_RECARGA, 0: 1 - PROB_OBTENER_RECARGA}
+    else:
+        raise ValueError(f"Acción desconocida: {accion}.")
+    p = Fraction(1, maximo - minimo + 1)
+    return {k: p for k in range(minimo, maximo + 1)}
+
+
+def distribucion_dano(municiones: int) -> Dict[int, Fraction]:
+    """Distribución exacta del daño de un ataque válido con ``municiones``."""
+    if municiones not in DADOS_ATAQUE:
+        raise ValueError("Cantidad de municiones inválida. Debe ser entre 1 y 3.")
+    return distribucion_tirada(municiones)
+
+
+def esperanza_dano(municiones: int) -> Fraction:
+    return sum((d * p for d, p in distribucion_dano(municiones).items()), Fraction(0))
+
+
+def prob_derribo(municiones: int, vida_rival: int) -> Fraction:
+    """Probabilidad exacta de dejar al rival con vida <= 0 en un solo ataque."""
+    return sum(
+        (p for d, p in distribucion_dano(municiones).items() if d >= vida_rival),
+        Fraction(0),
+    )
+
+
+class ComparacionAtaque(NamedTuple):
+    municiones: int
+    esperanza: Fraction
+    por_municion: Fraction
+    minimo: int
+    maximo: int
+    prob_derribo: Fraction
+
+
+def comparar_ataques(vida_rival: int = VIDA_INICIAL) -> List[ComparacionAtaque]:
+    """Tabla analítica para elegir entre atacar con 1, 2 o 3 municiones."""
+    filas: List[ComparacionAtaque] = []
+    for municiones in sorted(DADOS_ATAQUE):
+        distribucion = distribucion_dano(municiones)
+        esperanza = esperanza_dano(municiones)
+        filas.append(ComparacionAtaque(
+            municiones=municiones,
+            esperanza=esperanza,
+            por_municion=esperanza / municiones,
+            minimo=min(distribucion),
+            maximo=max(distribucion),
+            prob_derribo=prob_derribo(municiones, vida_rival),
+        ))
+    return filas
+
+
+def distribucion_paso(estado: Estado, accion: int) -> Dict[Estado, Fraction]:
+    """Distribución exacta de estados tras ejecutar ``accion`` en ``estado``."""
+    resultado: Dict[Estado, Fraction] = {}
+    for tirada, p in distribucion_tirada(accion).items():
+        siguiente = _aplicar(estado, accion, tirada)
+        resultado[siguiente] = resultado.get(siguiente, Fraction(0)) + p
+    return resultado
+
+
+# ---------------------------------------------------------------------------
+# Simulación por lotes
+# ---------------------------------------------------------------------------
+
+
+# accion -> (mínimo, número de valores, multiplicador) de las tiradas uniformes.
+_RANGOS_TIRADA: Dict[int, Tuple[int, int, int]] = {
+    **{accion: (1, caras, mult) for accion, (caras, mult) in DADOS_ATAQUE.items()},
+    RECARGAR_ENERGIA: (RECARGA_ENERGIA[0], RECARGA_ENERGIA[1] - RECARGA_ENERGIA[0] + 1, 1),
+    RECARGAR_VIDA: (RECARGA_VIDA[0], RECARGA_VIDA[1] - RECARGA_VIDA[0] + 1, 1),
+}
+
+
+def a_columnas(estados: Sequence[Estado]) -> Columnas:
+    """Convierte una lista de estados en siete columnas (una lista por campo)."""
+    if not estados:
+        return [[] for _ in range(len(ESTADO_INICIAL))]
+    return [list(columna) for columna in zip(*estados)]
+
+
+def a_estados(columnas: Columnas) -> List[Estado]:
+    return list(zip(*columnas))
+
+
+_DESCARTE = 255
+
+
+def _tabla_tiradas(accion: int) -> bytes:
+    """Tabla para ``bytes.translate``: byte aleatorio -> valor de la tirada.
+
+    Solo se aceptan los bytes por debajo del mayor múltiplo del número de
+    valores; el resto se marca con ``_DESCARTE`` y se vuelve a tirar, así que
+    la distribución es exactamente la de ``distribucion_tirada``.
+    """
+    if accion == OBTENER_RECARGA:
+        # Éxito (1) en ``numerator`` de cada ``denominator`` valores.
+        exitos = PROB_OBTENER_RECARGA.numerator
+        resultados = [int(k < exitos) for k in range(PROB_OBTENER_RECARGA.denominator)]
+    else:
+        minimo, valores, mult = _RANGOS_TIRADA[accion]
+        resultados = [(minimo + k) * mult for k in range(valores)]
+    valores = len(resultados)
+    aceptados = 256 - 256 % valores
+    return bytes(resultados[b % valores] if b < aceptados else _DESCARTE for b in range(256))
+
+
+_TABLAS_TIRADA: Dict[int, bytes] = {accion: _tabla_tiradas(accion) for accion in ACCIONES}
+
+
+def _tiradas(rng: random.Random, n: int, accion: int) -> bytes:
+    """Devuelve ``n`` tiradas de ``accion`` como bytes (todas caben en un byte)."""
+    tabla = _TABLAS_TIRADA[accion]
+    descarte = bytes((_DESCARTE,))
+    tiradas = rng.randbytes(n).translate(tabla).replace(descarte, b"")
+    # Las tiradas son independientes, así que las rechazadas se sustituyen
+    # añadiendo nuevas al final.
+    while len(tiradas) < n:
+        tiradas += rng.randbytes(n - len(tiradas)).translate(tabla).replace(descarte, b"")
+    return tiradas
+
+
+def _combinar(marca: Optional[Sequence[int]], condicion: Iterator[bool]) -> Sequence[int]:
+    """``marca AND condicion`` elemento a elemento; ``None`` equivale a todo 1."""
+    if marca is None:
+        return list(condicion)
+    return list(map(and_, marca, condicion))
+
+
+def paso_columnas(
+    columnas: Columnas,
+    acciones: Sequence[int],
+    rng: Optional[random.Random] = None,
+) -> Columnas:
+    """Avanza todas las partidas de ``columnas`` in situ, una acción por partida.
+
+    Trabaja columna a columna con ``map`` sobre operadores de ``operator``:
+    para cada combinación (acción, turno) presente se tiran todos los dados de
+    golpe (``randbytes`` + ``bytes.translate``) y se aplica la regla con
+    máscaras 0/1, sin bucles Python por partida. La distribución es la de
+    ``paso``, pero la secuencia no coincide para una semilla dada. Las partidas
+    ya terminadas no cambian.
+    """
+    v1, e1, r1, v2, e2, r2, turnos = columnas
+    n = len(v1)
+    if len(acciones) != n:
+        raise ValueError("Se necesita una acción por estado.")
+    if not n:
+        return columnas
+    presentes_accion = set(acciones)
+    desconocidas = presentes_accion.difference(_TABLAS_TIRADA)
+    if desconocidas:
+        raise ValueError(f"Acción desconocida: {min(desconocidas)}.")
+    generador = rng or random
+
+    # ``None`` indica "todas": evita construir máscaras en el caso habitual.
+    vivos: Optional[Sequence[int]] = None
+    if min(v1) <= 0 or min(v2) <= 0:
+        vivos = list(map(and_, map(gt, v1, repeat(0)), map(gt, v2, repeat(0))))
+    presentes_turno = set(turnos)
+    for accion in presentes_accion:
+        marca = vivos
+        if len(presentes_accion) > 1:
+            marca = _combinar(marca, map(eq, acciones, repeat(accion)))
+        for turno in presentes_turno:
+            marca_lado = marca
+            if len(presentes_turno) > 1:
+                marca_lado = _combinar(marca, map(eq, turnos, repeat(turno)))
+            if turno:
+                vida, energia, recargas, vida_rival = v2, e2, r2, v1
+            else:
+                vida, energia, recargas, vida_rival = v1, e1, r1, v2
+            tiradas = _tiradas(generador, n, accion)
+
+            if accion in DADOS_ATAQUE:
+                validos = _combinar(marca_lado, map(ge, energia, repeat(accion)))
+                vida_rival[:] = map(sub, vida_rival, map(mul, tiradas, validos))
+                energia[:] = map(sub, energia, map(mul, validos, repeat(accion)))
+            elif accion == RECARGAR_ENERGIA:
+                # energia <= ENERGIA_MAX siempre, así que min() cubre el caso "ya al máximo".
+                sumas = tiradas if marca_lado is None else map(mul, tiradas, marca_lado)
+                energia[:] = map(min, map(add, energia, sumas), repeat(ENERGIA_MAX))
+            elif accion == RECARGAR_VIDA:
+                validos = _combinar(marca_lado, map(gt, recargas, repeat(0)))
+                vida[:] = map(min, map(add, vida, map(mul, tiradas, validos)), repeat(VIDA_MAX))
+                recargas[:] = map(sub, recargas, validos)
+            else:
+                validos = _combinar(marca_lado, map(lt, recargas, repeat(1)))
+                recargas[:] = map(add, recargas, map(and_, validos, tiradas))
+
+    turnos[:] = map(xor, turnos, repeat(1)) if vivos is None else map(xor, turnos, vivos)
+    return columnas
+
+
+def paso_lote(
+    estados: Sequence[Estado],
+    acciones: Sequence[int],
+    rng: Optional[random.Random] = None,
+) -> List[Estado]:
+    """Versión de ``paso_columnas`` que recibe y devuelve tuplas de estado.
+
+    La conversión a columnas tiene su coste; para simulaciones largas conviene
+    mantener las columnas entre pasos, como hace ``simular``.
+    """
+    if len(estados) != len(acciones):
+        raise ValueError("Se necesita una acción por estado.")
+    return a_estados(paso_columnas(a_columnas(estados), acciones, rng))
+
+
+class PoliticaFija:
+    """Política que repite ``accion``, recargando energía cuando no le alcanza."""
+
+    def __init__(self, accion: int) -> None:
+        self.accion = accion
+
+    def __call__(self, estado: Estado) -> int:
+        energia = estado[4] if estado[6] else estado[1]
+        if self.accion in DADOS_ATAQUE and energia < self.accion:
+            return RECARGAR_ENERGIA
+        return self.accion
+
+    def lote(self, columnas: Columnas, turno: int) -> List[int]:
+        """Acciones para todas las partidas de ``columnas`` cuando juega ``turno``."""
+        n = len(columnas[0])
+        if self.accion not in DADOS_ATAQUE:
+            return [self.accion] * n
+        energia = columnas[4] if turno else columnas[1]
+        # accion si hay energía suficiente, RECARGAR_ENERGIA si no.
+        suficiente = map(ge, energia, repeat(self.accion))
+        return list(map(add, map(mul, suficiente, repeat(self.accion - RECARGAR_ENERGIA)), repeat(RECARGAR_ENERGIA)))
+
+
+def politica_fija(accion: int) -> PoliticaFija:
+    return PoliticaFija(accion)
+
+
+def _acciones_lote(politica: Politica, columnas: Columnas, turno: int) -> List[int]:
+    lote = getattr(politica, "lote", None)
+    if lote is not None:
+        return lote(columnas, turno)
+    return list(map(politica, a_estados(columnas)))
+
+
+def simular(
+    politica1: Politica,
+    politica2: Politica,
+    partidas: int = 10_000,
+    rng: Optional[random.Random] = None,
+    max_turnos: int = 1_000,
+) -> Dict[str, float]:
+    """Juega ``partidas`` en paralelo y devuelve proporciones de victoria.
+
+    Todas las partidas avanzan a la vez en columnas y las terminadas se
+    retiran en cada turno. Las políticas con método ``lote`` (como
+    ``PoliticaFija``) deciden para todo el lote; el resto se llama por estado.
+    Las partidas que superan ``max_turnos`` se cuentan como empate.
+    """
+    if partidas <= 0:
+        return {"jugador1": 0.0, "jugador2": 0.0, "empate": 0.0, "turnos_medios": 0.0}
+    columnas = a_columnas([ESTADO_INICIAL] * partidas)
+    victorias1 = victorias2 = 0
+    suma_turnos = 0
+    turnos = 0
+    # Todas las partidas empiezan a la vez, así que comparten turno en cada paso.
+    turno = ESTADO_INICIAL[6]
+    while columnas[0] and turnos < max_turnos:
+        politica = politica2 if turno else politica1
+        paso_columnas(columnas, _acciones_lote(politica, columnas, turno), rng)
+        turnos += 1
+        turno ^= 1
+        v1, v2 = columnas[0], columnas[3]
+        derrotas2 = sum(map(le, v2, repeat(0)))
+        derrotas1 = sum(map(le, v1, repeat(0)))
+        if derrotas1 or derrotas2:
+            victorias1 += derrotas2
+            victorias2 += derrotas1
+            suma_turnos += turnos * (derrotas1 + derrotas2)
+            siguen = list(map(and_, map(gt, v1, repeat(0)), map(gt, v2, repeat(0))))
+            columnas = [list(compress(columna, siguen)) for columna in columnas]
+
+    terminadas = victorias1 + victorias2
+    return {
+        "jugador1": victorias1 / partidas,
+        "jugador2": victorias2 / partidas,
+        "empate": (partidas - terminadas) / partidas,
+        "turnos_medios": suma_turnos / terminadas if terminadas else 0.0,
+    }
@@ -0,0 +1,161 @@
+"""Backends de renderizado para la terminal.
+
+Cada backend traduce estilos con nombre (``"cian"``, ``"brillante"``...) a la
+salida final. Las dependencias externas se importan solo al crear el backend
+que las usa, así que importar el juego para simulaciones no carga ``colorama``
+ni ``rich``. El backend plano no genera ni analiza secuencias ANSI.
+"""
+
+from __future__ import annotations
+
+import re
+from typing import Dict, Iterable, Tuple, Type
+
+ANSI_PATTERN = re.compile(r"\x1b\[[0-9;]*m")
+
+# Estilos disponibles. ➜ Si añades uno, defínelo en todos los backends.
+ESTILOS = (
+    "cian",
+    "rojo",
+    "verde",
+    "amarillo",
+    "magenta",
+    "blanco",
+    "rojo_claro",
+    "azul_claro",
+    "brillante",
+    "tenue",
+)
+_ESTILOS_VALIDOS = frozenset(ESTILOS)
+
+
+def validar_estilos(estilos: Iterable[str]) -> None:
+    """Lanza ``ValueError`` si algún nombre no está en ``ESTILOS``."""
+    desconocidos = sorted(set(estilos) - _ESTILOS_VALIDOS)
+    if desconocidos:
+        opciones = ", ".join(ESTILOS)
+        raise ValueError(f"Estilo desconocido: {', '.join(desconocidos)} (opciones: {opciones}).")
+
+
+class RenderPlano:
+    """Texto sin color: apto para pipes, registros y procesos sin terminal."""
+
+    nombre = "plano"
+    color = False
+
+    def estilo(self, texto: str, *estilos: str) -> str:
+        # Se validan igual que en los backends con color para que un nombre
+        # erróneo no pase desapercibido solo en modo plano.
+        validar_estilos(estilos)
+        return texto
+
+    def ancho_visual(self, texto: str) -> int:
+        return len(texto)
+
+    def limpiar_pantalla(self) -> None:
+        print()
+
+
+class RenderAnsi(RenderPlano):
+    """Colores ANSI mediante ``colorama``."""
+
+    nombre = "ansi"
+    color = True
+
+    def __init__(self) -> None:
+        from colorama import Fore, Style, init
+
+        init(autoreset=True)
+        self._codigos: Dict[str, str] = {
+            "cian": Fore.CYAN,
+            "rojo": Fore.RED,
+            "verde": Fore.GREEN,
+            "amarillo": Fore.YELLOW,
+            "magenta": Fore.MAGENTA,
+            "blanco": Fore.WHITE,
+            "rojo_claro": Fore.LIGHTRED_EX,
+            "azul_claro": Fore.LIGHTBLUE_EX,
+            "brillante": Style.BRIGHT,
+            "tenue": Style.DIM,
+        }
+        self._reset = Style.RESET_ALL
+
+    def estilo(self, texto: str, *estilos: str) -> str:
+        if not estilos:
+            return texto
+        try:
+            codigos = "".join(self._codigos[e] for e in estilos)
+        except KeyError:
+            validar_estilos(estilos)
+            raise
+        return codigos + texto + self._reset
+
+    def ancho_visual(self, texto: str) -> int:
+        return len(ANSI_PATTERN.sub("", texto))
+
+    def limpiar_pantalla(self) -> None:
+        print("\033[2J\033[H", end="")
+
+
+class RenderRich(RenderPlano):
+    """Estilos generados por ``rich``, que detecta el soporte de color de la terminal."""
+
+    nombre = "rich"
+    color = True
+
+    def __init__(self) -> None:
+        from rich.console import COLOR_SYSTEMS, Console
+        from rich.style import Style
+
+        self._consola = Console()
+        # ``Style.render`` espera un ``ColorSystem``; con el nombre en texto no
+        # adapta los colores a la terminal.
+        self._sistema_color = COLOR_SYSTEMS.get(self._consola.color_system)
+        nombres = {
+            "cian": "cyan",
+            "rojo": "red",
+            "verde": "green",
+            "amarillo": "yellow",
+            "magenta": "magenta",
+            "blanco": "white",
+            "rojo_claro": "bright_red",
+            "azul_claro": "bright_blue",
+            "brillante": "bold",
+            "tenue": "dim",
+        }
+        self._estilos = {clave: Style.parse(valor) for clave, valor in nombres.items()}
+        self._combinados: Dict[Tuple[str, ...], "Style"] = {}
+        self._combinar = Style.combine
+
+    def estilo(self, texto: str, *estilos: str) -> str:
+        if not estilos:
+            return texto
+        estilo = self._combinados.get(estilos)
+        if estilo is None:
+            validar_estilos(estilos)
+            estilo = self._combinar(self._estilos[e] for e in estilos)
+            self._combinados[estilos] = estilo
+        return estilo.render(texto, color_system=self._sistema_color)
+
+    def ancho_visual(self, texto: str) -> int:
+        return len(ANSI_PATTERN.sub("", texto))
+
+    def limpiar_pantalla(self) -> None:
+        self._consola.clear()
+
+
+BACKENDS: Dict[str, Type[RenderPlano]] = {
+    RenderPlano.nombre: RenderPlano,
+    RenderAnsi.nombre: RenderAnsi,
+    RenderRich.nombre: RenderRich,
+}
+
+
+def crear_renderizador(nombre: str) -> RenderPlano:
+    """Instancia el backend indicado; importa su dependencia en este momento."""
+    try:
+        clase = BACKENDS[nombre]
+    except KeyError:
+        opciones = ", ".join(BACKENDS)
+        raise ValueError(f"Backend de renderizado desconocido: {nombre!r} (opciones: {opciones}).") from None
+    return clase()
@@ -0,0 +1,234 @@
+"""Tablero en vivo de ``prueba1``: una única pantalla persistente en la
+pantalla alternativa de la terminal.
+
+Depende de ``rich``; ``prueba1`` solo importa este módulo al empezar una
+partida en modo en vivo.
+"""
+
+from collections import deque
+from functools import lru_cache
+
+from rich.cells import cell_len
+from rich.columns import Columns
+from rich.console import COLOR_SYSTEMS
+from rich.control import Control
+from rich.measure import Measurement
+from rich.panel import Panel
+from rich.segment import ControlType
+from rich.text import Text
+
+import motor_prueba1 as motor
+
+# Etiquetas estáticas parseadas una sola vez.
+TITULO_ESTADISTICAS = Text.from_markup(f"[magenta bold]{' ESTADÍSTICAS ':-^30}[/magenta bold]")
+ETIQUETA_VIDA = Text.from_markup("[green bold]VIDA:[/green bold] ")
+ETIQUETA_ENERGIA = Text.from_markup("[yellow bold]ENERGÍA:[/yellow bold] ")
+ETIQUETA_RECARGAS = Text.from_markup("[red bold]RECARGAS:[/red bold] ")
+AVISO_OPCION_INVALIDA = Text("Selecciona una de las opciones disponibles.", style="red bold")
+TITULO_REGISTRO = Text("Últimos eventos", style="bold")
+CONTROL_BORRAR_LINEA = Control((ControlType.ERASE_IN_LINE, 0)).segment.text
+CONTROL_BORRAR_PANTALLA = Control.clear().segment.text
+# ➜ Mensajes visibles en el registro del modo en vivo.
+LINEAS_REGISTRO = 6
+
+
+@lru_cache(maxsize=None)
+def linea_vida(vida):
+    """Fila de vida; se cachea por valor para no reconstruir segmentos repetidos."""
+    # Ancho fijo (número alineado y barra de 20) para que el panel no cambie
+    # de tamaño y solo se reescriba esta fila.
+    llenos = min(max(vida // 6, 0), 20)
+    vacios = 20 - llenos
+    return Text.assemble(
+        ETIQUETA_VIDA,
+        f"{vida:>3}/{motor.VIDA_MAX} ",
+        ("█" * llenos, "bold green"),
+        ("░" * vacios, "bold red"),
+    )
+
+
+@lru_cache(maxsize=None)
+def linea_energia(energia):
+    return Text.assemble(
+        ETIQUETA_ENERGIA,
+        ("■ " * energia, "bold yellow"),
+        ("□ " * (motor.ENERGIA_MAX - energia), "dim white"),
+    )
+
+
+@lru_cache(maxsize=None)
+def linea_recargas(disponible):
+    if disponible:
+        return Text.assemble(ETIQUETA_RECARGAS, ("■", "bold red"))
+    return Text.assemble(ETIQUETA_RECARGAS, ("□", "dim white"))
+
+
+class FichaJugador:
+    """Contenido de un panel de estadísticas; solo cambia las filas modificadas."""
+
+    def __init__(self, jugador):
+        self.nombre = Text(jugador, style="cyan bold")
+        self.vida = self.energia = self.recargas = None
+        self.filas = [self.nombre, Text(), Text(), Text()]
+
+    def actualizar(self, vida, energia, recargas):
+        if vida != self.vida:
+            self.vida = vida
+            self.filas[1] = linea_vida(vida)
+        if energia != self.energia:
+            self.energia = energia
+            self.filas[2] = linea_energia(energia)
+        if recargas != self.recargas:
+            self.recargas = recargas
+            self.filas[3] = linea_recargas(recargas > 0)
+
+    def __rich_console__(self, console, options):
+        yield from self.filas
+
+    def __rich_measure__(self, console, options):
+        ancho = max(fila.cell_len for fila in self.filas)
+        return Measurement(ancho, ancho)
+
+
+class Tablero:
+    """Pantalla persistente del modo en vivo.
+
+    Ocupa la pantalla alternativa de la terminal con los paneles de ambos
+    jugadores, los últimos mensajes, el turno, el menú y la línea de entrada.
+    Se pinta al abrirse y antes de cada pregunta, de modo que todos los
+    cambios entre dos preguntas se agrupan en un solo redibujado. Cada
+    redibujado compara las líneas renderizadas con las de la pantalla y solo
+    reescribe las que cambiaron, con posicionamiento absoluto del cursor;
+    así el coste no depende del ancho de la terminal.
+    """
+
+    def __init__(self, jugador1, jugador2, menu, consola):
+        self.consola = consola
+        self.fichas = (FichaJugador(jugador1), FichaJugador(jugador2))
+        # Columns apila los paneles si no caben uno al lado del otro.
+        self.paneles = Columns(
+            [
+                Panel(ficha, title=TITULO_ESTADISTICAS, border_style="bright_magenta", expand=False)
+                for ficha in self.fichas
+            ],
+            padding=(0, 2),
+        )
+        self.menu = Text(menu)
+        self.registro = deque(maxlen=LINEAS_REGISTRO)
+        self.turno = None
+        self.aviso = None
+        self.entrada = None
+        # Lo escrito en cada fila de la pantalla; ``None`` si se desconoce.
+        self.pantalla = []
+        self.tamano = None
+        self.fila_entrada = 0
+        self.pantalla_alternativa = consola.screen(hide_cursor=True)
+        # ``Style.render`` espera un ``ColorSystem``, no el nombre en texto.
+        self.sistema_color = COLOR_SYSTEMS.get(consola.color_system)
+
+    def __rich_console__(self, console, options):
+        yield self.paneles
+        yield TITULO_REGISTRO
+        yield from self.registro
+        yield from [Text()] * (LINEAS_REGISTRO - len(self.registro))
+        if self.turno is not None:
+            yield self.turno
+            yield self.menu
+        if self.aviso is not None:
+            yield self.aviso
+        if self.entrada is not None:
+            yield self.entrada
+
+    def __enter__(self):
+        self.pantalla_alternativa.__enter__()
+        self.pintar()
+        return self
+
+    def __exit__(self, *exc):
+        self.pantalla_alternativa.__exit__(*exc)
+        # La pantalla alternativa desaparece al salir: se deja el estado final.
+        self.consola.print(self.paneles)
+        for mensaje in self.registro:
+            self.consola.print(mensaje)
+
+    def registrar(self, mensaje):
+        self.registro.append(Text.from_markup(mensaje))
+
+    def _lineas(self, alto):
+        lineas = []
+        for segmentos in self.consola.render_lines(self, self.consola.options, pad=False):
+            lineas.append("".join(
+                segmento.style.render(segmento.text, color_system=self.sistema_color)
+                if segmento.style else segmento.text
+                for segmento in segmentos
+                if not segmento.control
+            ))
+        if len(lineas) > alto:
+            # La línea de entrada es la última y nunca debe quedar fuera.
+            lineas = lineas[: alto - 1] + lineas[-1:]
+        self.fila_entrada = len(lineas) - 1
+        return lineas + [""] * (alto - len(lineas))
+
+    def pintar(self):
+        """Escribe solo las filas que difieren de lo que hay en pantalla."""
+        tamano = self.consola.size
+        if tamano != self.tamano:
+            self.tamano = tamano
+            self.pantalla = [None] * tamano.height
+            self.consola.file.write(CONTROL_BORRAR_PANTALLA)
+        lineas = self._lineas(tamano.height)
+        salida = []
+        for y, (nueva, actual) in enumerate(zip(lineas, self.pantalla)):
+            if nueva != actual:
+                salida.append(f"{Control.move_to(0, y).segment.text}{nueva}{CONTROL_BORRAR_LINEA}")
+                self.pantalla[y] = nueva
+        if salida:
+            self.consola.file.write("".join(salida))
+            self.consola.file.flush()
+
+    def actualizar(self, indice, vida, energia, recargas):
+        self.fichas[indice].actualizar(vida, energia, recargas)
+
+    def mostrar_turno(self, jugador):
+        self.turno = Text(f"Turno de {jugador}", style="magenta bold")
+
+    def preguntar(self, texto, choices=None):
+        """Equivalente a ``Prompt.ask`` con la línea de entrada dentro del tablero."""
+        if choices:
+            self.entrada = Text.assemble(texto, " ", (f"[{'/'.join(choices)}]", "magenta bold"), ": ")
+        else:
+            self.entrada = Text(f"{texto}: ")
+        while True:
+            self.pintar()
+            respuesta = self._leer()
+            if not choices or respuesta in choices:
+                self.aviso = self.entrada = None
+                return respuesta
+            self.aviso = AVISO_OPCION_INVALIDA
+
+    def _leer(self):
+        """Lee una línea con el cursor tras la línea de entrada.
+
+        El eco de ``input()`` puede ocupar varias filas o desplazar la
+        pantalla; como el tablero usa posiciones absolutas, basta con marcar
+        como desconocidas las filas afectadas para que el próximo redibujado las
+        reescriba.
+        """
+        alto = self.tamano.height
+        fila = self.fila_entrada
+        columna = self.entrada.cell_len
+        self.consola.file.write(Control.move_to(columna, fila).segment.text)
+        self.consola.file.flush()
+        self.consola.show_cursor(True)
+        try:
+            respuesta = input().strip()
+        finally:
+            self.consola.show_cursor(False)
+        filas_eco = (columna + cell_len(respuesta)) // max(self.tamano.width, 1) + 1
+        if fila + filas_eco >= alto:
+            # El salto de línea final ha desplazado la pantalla entera.
+            self.pantalla = [None] * alto
+        else:
+            for y in range(fila, alto):
+                self.pantalla[y] = None
+        return respuesta
@@ -0,0 +1,101 @@
+"""Pruebas exactas del motor de ``prueba1``."""
+
+import random
+from collections import Counter
+from fractions import Fraction
+from itertools import product
+
+import pytest
+
+import motor_prueba1 as motor
+
+
+# Estados que recorren todas las ramas: sin energía, energía al máximo, sin
+# recargas, vida cerca del máximo, ambos turnos y partidas ya terminadas.
+ESTADOS = [
+    motor.ESTADO_INICIAL,
+    (100, 0, 0, 100, 5, 1, 0),
+    (120, 5, 1, 7, 1, 0, 0),
+    (3, 2, 0, 125, 3, 1, 1),
+    (50, 4, 1, 118, 0, 0, 1),
+    (0, 3, 1, 40, 2, 0, 0),
+    (40, 2, 1, -12, 5, 1, 1),
+]
+
+
+def test_tablas_de_lote_coinciden_con_la_distribucion_exacta():
+    for accion in motor.ACCIONES:
+        cuenta = Counter(b for b in motor._TABLAS_TIRADA[accion] if b != motor._DESCARTE)
+        total = sum(cuenta.values())
+        assert {valor: Fraction(n, total) for valor, n in cuenta.items()} == motor.distribucion_tirada(accion)
+
+
+def test_paso_lote_solo_produce_estados_posibles():
+    combinaciones = list(product(ESTADOS, motor.ACCIONES))
+    estados = [estado for estado, _ in combinaciones] * 200
+    acciones = [accion for _, accion in combinaciones] * 200
+    resultado = motor.paso_lote(estados, acciones, random.Random(2024))
+
+    assert len(resultado) == len(estados)
+    vistos = {}
+    for estado, accion, siguiente in zip(estados, acciones, resultado):
+        if motor.terminado(estado):
+            assert siguiente == estado
+            continue
+        soporte = motor.distribucion_paso(estado, accion)
+        assert siguiente in soporte, (estado, accion, siguiente)
+        vistos.setdefault((estado, accion), set()).add(siguiente)
+    # Con 200 repeticiones aparecen todos los resultados de las acciones con
+    # pocos valores posibles (recargas y obtener recarga).
+    for (estado, accion), salidas in vistos.items():
+        if accion in (motor.RECARGAR_ENERGIA, motor.OBTENER_RECARGA):
+            assert salidas == set(motor.distribucion_paso(estado, accion))
+
+
+def test_paso_lote_es_determinista_con_semilla():
+    estados = ESTADOS * 10
+    acciones = [motor.ACCIONES[i % len(motor.ACCIONES)] for i in range(len(estados))]
+    assert motor.paso_lote(estados, acciones, random.Random(7)) == motor.paso_lote(estados, acciones, random.Random(7))
+
+
+def test_paso_lote_rechaza_entradas_invalidas():
+    with pytest.raises(ValueError):
+        motor.paso_lote([motor.ESTADO_INICIAL], [])
+    with pytest.raises(ValueError, match="desconocida"):
+        motor.paso_lote([motor.ESTADO_INICIAL], [9])
+
+
+def test_paso_individual_en_el_soporte():
+    rng = random.Random(1)
+    for estado, accion in product(ESTADOS, motor.ACCIONES):
+        if not motor.terminado(estado):
+            assert motor.paso(estado, accion, rng) in motor.distribucion_paso(estado, accion)
+
+
+def test_obtener_recarga_consume_como_prueba1():
+    a, b = random.Random(99), random.Random(99)
+    assert [motor.tirada_obtener_recarga(a) for _ in range(500)] == [b.choice([True, False]) for _ in range(500)]
+
+
+def test_comparar_ataques():
+    assert motor.comparar_ataques(30) == [
+        motor.ComparacionAtaque(1, Fraction(21, 2), Fraction(21, 2), 1, 20, Fraction(0)),
+        motor.ComparacionAtaque(2, Fraction(19), Fraction(19, 2), 2, 36, Fraction(2, 9)),
+        motor.ComparacionAtaque(3, Fraction(24), Fraction(8), 3, 45, Fraction(2, 5)),
+    ]
+
+
+def test_distribucion_paso_suma_uno():
+    for estado, accion in product(ESTADOS, motor.ACCIONES):
+        assert sum(motor.distribucion_paso(estado, accion).values()) == 1
+
+
+def test_simular_proporciones():
+    resultado = motor.simular(
+        motor.politica_fija(motor.ATACAR_3),
+        motor.politica_fija(motor.ATACAR_1),
+        partidas=500,
+        rng=random.Random(3),
+    )
+    assert resultado["jugador1"] + resultado["jugador2"] + resultado["empate"] == pytest.approx(1)
+    assert resultado["turnos_medios"] > 0
@@ -0,0 +1,120 @@
+"""Pruebas de las instantáneas binarias de ``batalla_tactica``."""
+
+import os
+import struct
+import zlib
+
+import pytest
+
+import batalla_tactica as bt
+
+
+def partida_de_prueba() -> bt.Partida:
+    jugador = bt.Fighter("Jugador", 100, 18, 9, 4, 0.15, 0.08)
+    enemigo = bt.Fighter("Enemigo", 90, 16, 8, 5, 0.1, 0.0625)
+    jugador.hp, jugador.en, jugador.cargas = 37, 11, 1
+    enemigo.hp, enemigo.en, enemigo.cargas = 0, 16, 0
+    jugador.estado.add("DEF")
+    return bt.Partida(jugador, enemigo, ronda=12, jugador_recargo=True)
+
+
+def mismos_datos(a: bt.Fighter, b: bt.Fighter) -> bool:
+    campos = ("nombre", "max_hp", "max_en", "atk", "df", "crit", "evd", "estado", "hp", "en", "cargas")
+    return all(getattr(a, campo) == getattr(b, campo) for campo in campos)
+
+
+def con_checksum(cuerpo: bytes) -> bytes:
+    return cuerpo + struct.pack("<I", zlib.crc32(cuerpo))
+
+
+def test_ida_y_vuelta_exacta():
+    partida = partida_de_prueba()
+    datos = bt.serializar_partida(partida)
+    assert len(datos) == bt.SNAPSHOT_SIZE
+
+    copia = bt.deserializar_partida(datos)
+    assert copia.ronda == 12
+    assert copia.jugador_recargo is True
+    assert mismos_datos(copia.jugador, partida.jugador)
+    assert mismos_datos(copia.enemigo, partida.enemigo)
+    assert bt.serializar_partida(copia) == datos
+
+
+def test_checksum_detecta_un_byte_alterado():
+    datos = bytearray(bt.serializar_partida(partida_de_prueba()))
+    datos[10] ^= 0x01
+    with pytest.raises(ValueError, match="checksum"):
+        bt.deserializar_partida(bytes(datos))
+
+
+@pytest.mark.parametrize("recorte", [0, 1, bt.SNAPSHOT_SIZE - 1])
+def test_tamano_invalido(recorte):
+    datos = bt.serializar_partida(partida_de_prueba())
+    with pytest.raises(ValueError, match="tamaño"):
+        bt.deserializar_partida(datos[:recorte])
+
+
+def test_magic_y_version_con_checksum_valido():
+    cuerpo = bt.serializar_partida(partida_de_prueba())[:-4]
+    with pytest.raises(ValueError, match="no son una instantánea"):
+        bt.deserializar_partida(con_checksum(b"XX" + cuerpo[2:]))
+    with pytest.raises(ValueError, match="Versión"):
+        bt.deserializar_partida(con_checksum(cuerpo[:2] + bytes([99]) + cuerpo[3:]))
+
+
+def test_guardar_y_cargar(tmp_path):
+    ruta = tmp_path / "partida.bin"
+    assert bt.cargar_partida(str(ruta)) is None
+
+    bt.guardar_partida(str(ruta), partida_de_prueba())
+    copia = bt.cargar_partida(str(ruta))
+    assert copia.ronda == 12
+    assert mismos_datos(copia.jugador, partida_de_prueba().jugador)
+    assert [p.name for p in tmp_path.iterdir()] == ["partida.bin"]
+
+
+def test_cargar_archivo_corrupto(tmp_path):
+    ruta = tmp_path / "partida.bin"
+    ruta.write_bytes(b"no es una partida")
+    with pytest.raises(ValueError):
+        bt.cargar_partida(str(ruta))
+
+
+@pytest.mark.skipif(os.name == "nt", reason="permisos POSIX")
+def test_permisos_nuevos_siguen_la_umask(tmp_path):
+    ruta = tmp_path / "partida.bin"
+    anterior = os.umask(0o027)
+    try:
+        bt.guardar_partida(str(ruta), partida_de_prueba())
+    finally:
+        os.umask(anterior)
+    assert ruta.stat().st_mode & 0o777 == 0o640
+
+
+@pytest.mark.skipif(os.name == "nt", reason="permisos POSIX")
+def test_permisos_existentes_se_conservan(tmp_path):
+    ruta = tmp_path / "partida.bin"
+    ruta.write_bytes(b"")
+    ruta.chmod(0o604)
+    bt.guardar_partida(str(ruta), partida_de_prueba())
+    assert ruta.stat().st_mode & 0o777 == 0o604
+
+
+def test_lote_ida_y_vuelta(tmp_path):
+    ruta = tmp_path / "lote.bin"
+    partidas = {1: partida_de_prueba(), 2**40: partida_de_prueba()}
+    partidas[2**40].ronda = 3
+    bt.guardar_lote(str(ruta), partidas)
+
+    copia = bt.cargar_lote(str(ruta))
+    assert list(copia) == [1, 2**40]
+    assert copia[1].ronda == 12
+    assert copia[2**40].ronda == 3
+
+
+def test_lote_truncado(tmp_path):
+    ruta = tmp_path / "lote.bin"
+    bt.guardar_lote(str(ruta), {7: partida_de_prueba()})
+    ruta.write_bytes(ruta.read_bytes()[:-1])
+    with pytest.raises(ValueError, match="truncado"):
+        bt.cargar_lote(str(ruta))
@@ -0,0 +1,25 @@
+"""Pruebas de los backends de ``renderizado`` que no requieren dependencias."""
+
+import pytest
+
+import renderizado
+
+
+def test_plano_no_altera_el_texto():
+    plano = renderizado.crear_renderizador("plano")
+    assert plano.estilo("Victoria.", "brillante", "verde") == "Victoria."
+    assert plano.ancho_visual("Victoria.") == 9
+
+
+def test_estilo_desconocido_falla_tambien_en_plano():
+    with pytest.raises(ValueError, match="cyan"):
+        renderizado.crear_renderizador("plano").estilo("x", "cyan")
+
+
+def test_validar_estilos_acepta_todos_los_definidos():
+    renderizado.validar_estilos(renderizado.ESTILOS)
+
+
+def test_backend_desconocido():
+    with pytest.raises(ValueError, match="desconocido"):
+        renderizado.crear_renderizador("html")